@@ -1,8 +1,10 @@
-import pyautogui
 import time
 import logging
 import sys
 
+# pyautogui (and the OpenCV it pulls in for confidence matching) is imported
+# inside the helpers that use it so the module itself loads instantly.
+
 # ==============================
 # Configurable constants
 # ==============================
@@ -28,6 +30,7 @@ logging.basicConfig(
 # Helper functions
 # ==============================
 def find_icon(icon_path, confidence=DEFAULT_CONFIDENCE):
+    import pyautogui
     try:
         location = pyautogui.locateCenterOnScreen(icon_path, confidence=confidence)
         return (location.x, location.y) if location else None
@@ -36,6 +39,7 @@ def find_icon(icon_path, confidence=DEFAULT_CONFIDENCE):
         return None
 
 def click_icon(icon_path, confidence=DEFAULT_CONFIDENCE, timeout=DEFAULT_TIMEOUT):
+    import pyautogui
     logging.info(f"Looking for {icon_path}...")
     start_time = time.time()
     wait_time = 0.5
@@ -59,6 +63,7 @@ def compose_and_send_email():
     """
     Automate composing and sending an email in Gmail.
     """
+    import pyautogui
     # Step 1: Click compose button
     if not click_icon(COMPOSE_ICON, timeout=15):
         return False
@@ -98,6 +103,7 @@ def compose_and_send_email():
 # Core automation
 # ==============================
 def focus_search_bar():
+    import pyautogui
     if click_icon(SEARCH_BAR_ICON, timeout=5):
         return True
     
@@ -119,6 +125,7 @@ def focus_search_bar():
     return False
 
 def focus_window():
+    import pyautogui
     screen_w, screen_h = pyautogui.size()
     center_x, center_y = screen_w // 2, screen_h // 2
     pyautogui.click(center_x, center_y)
@@ -126,6 +133,7 @@ def focus_window():
     time.sleep(1)
 
 def open_browser_and_navigate():
+    import pyautogui
     if not click_icon(BROWSER_ICON, timeout=15):
         logging.error("Browser icon not found. Please make sure browser.png exists.")
         return False
@@ -1,22 +1,240 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import json
+import os
+
+from near_duplicates import NearDuplicateIndex, DEFAULT_THRESHOLD
+
+# Selenium is imported inside the functions that need it so that importing
+# this module (or spawning a worker from it) stays cheap.
+
+# Persistent cache of resolved ChromeDriver paths, keyed by Chrome version
+DRIVER_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'linkedin_scraper', 'chromedriver.json'
+)
+
+CHROME_BINARIES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+def get_chrome_version():
+    """Return the installed Chrome version string, or None if it can't be found"""
+    import re
+    import shutil
+    import subprocess
+
+    if os.name == 'nt':
+        # On Windows the version lives in the registry, not in --version output
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            return winreg.QueryValueEx(key, "version")[0]
+        except Exception:
+            return None
+
+    for binary in CHROME_BINARIES:
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if not path or not os.path.exists(path):
+            continue
+        try:
+            output = subprocess.run(
+                [path, '--version'], capture_output=True, text=True, timeout=10
+            ).stdout
+        except Exception:
+            continue
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_driver_cache():
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_driver_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"Could not write driver cache: {e}")
+
+
+def resolve_chromedriver(offline=False):
+    """Return a ChromeDriver path, reusing the cached one for this Chrome version.
+
+    With offline=True the network is never touched: the cache is used first,
+    then any chromedriver found on PATH.
+    """
+    import shutil
+
+    chrome_version = get_chrome_version() or 'unknown'
+    cache = _load_driver_cache()
+
+    cached_path = cache.get(chrome_version)
+    if cached_path and os.path.exists(cached_path):
+        return cached_path
+
+    if offline:
+        path_driver = shutil.which('chromedriver')
+        if path_driver:
+            return path_driver
+        raise RuntimeError(
+            f"Offline mode: no cached ChromeDriver for Chrome {chrome_version} "
+            "and none found on PATH. Run once without offline mode first."
+        )
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = ChromeDriverManager().install()
+
+    # Only cache when we know which Chrome the driver belongs to
+    if chrome_version != 'unknown':
+        cache[chrome_version] = driver_path
+        _save_driver_cache(cache)
+    return driver_path
+
+
+# Requests blocked in lean mode (images are also disabled via Chrome prefs)
+LEAN_BLOCKED_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*media.licdn.com/*', '*dms.licdn.com/*',
+]
+
+# Replaces fully extracted post nodes with empty placeholders of the same
+# height so the DOM stays small while the scroll position stays stable.
+PRUNE_POSTS_SCRIPT = """
+const [posts, pending] = arguments;
+let pruned = 0;
+for (const el of posts) {
+    if (!el.isConnected || pending.includes(el)) continue;
+    const placeholder = document.createElement('div');
+    placeholder.setAttribute('data-lean-placeholder', '');
+    placeholder.style.height = el.offsetHeight + 'px';
+    el.replaceWith(placeholder);
+    pruned++;
+}
+return pruned;
+"""
+
+# Clicks every displayed "see more" button whose text block hasn't been
+# clicked yet, then waits in the page until every clicked text block shows it
+# has expanded: its toggle is gone, hidden, flipped to aria-expanded/"see less",
+# or the block's class or scrollHeight changed. Text growth is only a fallback,
+# since innerText already includes CSS-clamped text.
+# The click marker lives on the text block, not the post, so a repost with
+# commentary gets both of its toggles expanded. Posts still waiting when the
+# timeout passes are returned so they can be retried on the next scroll; a
+# block that still shows no change after four timeouts is treated as expanded.
+# Runs as an async script: the last argument is the completion callback.
+EXPAND_SEE_MORE_SCRIPT = """
+const [buttonSelector, postSelector, timeoutMs, done] = arguments;
+const start = performance.now();
+let expanded = 0;
+for (const button of document.querySelectorAll(buttonSelector)) {
+    const text = button.closest('.feed-shared-inline-show-more-text') || button.parentElement;
+    if (text.hasAttribute('data-see-more-clicked')) continue;
+    if (button.disabled || button.offsetParent === null) continue;
+    text.setAttribute('data-see-more-clicked', text.innerText.length);
+    text.setAttribute('data-see-more-at', start);
+    text.setAttribute('data-see-more-height', text.scrollHeight);
+    text.setAttribute('data-see-more-class', text.className);
+    button.click();
+    expanded++;
+}
+const collapsedToggle = text => [...text.querySelectorAll(buttonSelector)].some(button =>
+    button.offsetParent !== null
+    && button.getAttribute('aria-expanded') !== 'true'
+    && !/less/i.test(button.getAttribute('aria-label') || button.innerText));
+const isExpanded = text => !collapsedToggle(text)
+    || text.className !== text.getAttribute('data-see-more-class')
+    || text.scrollHeight !== Number(text.getAttribute('data-see-more-height'))
+    || text.innerText.length > Number(text.getAttribute('data-see-more-clicked'));
+const waiting = () => [...document.querySelectorAll('[data-see-more-clicked]:not([data-see-more-expanded])')]
+    .filter(text => {
+        const givenUp = performance.now() - Number(text.getAttribute('data-see-more-at')) > timeoutMs * 4;
+        if (!isExpanded(text) && !givenUp) return true;
+        text.setAttribute('data-see-more-expanded', '');
+        return false;
+    });
+const poll = () => {
+    const pendingText = waiting();
+    if (pendingText.length && performance.now() - start <= timeoutMs) {
+        setTimeout(poll, 25);
+        return;
+    }
+    // Every post element (outer and nested) that holds a still-truncated text
+    const pending = [];
+    for (const text of pendingText) {
+        let node = text.closest(postSelector);
+        while (node) {
+            pending.push(node);
+            node = node.parentElement && node.parentElement.closest(postSelector);
+        }
+    }
+    done({expanded: expanded, pending: pending});
+};
+poll();
+"""
+
+SEE_MORE_SELECTOR = (
+    "button.feed-shared-inline-show-more-text__see-more-less-toggle, "
+    "button[aria-label*='see more'], "
+    "button.see-more"
+)
+
+POST_SELECTOR = (
+    "div.feed-shared-update-v2, "
+    "div[data-urn*='activity'], "
+    "div.feed-shared-update-v2__content"
+)
+
+# Height, JS heap and DOM size in one round-trip
+PAGE_STATS_SCRIPT = """
+return {
+    height: document.body.scrollHeight,
+    heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+    nodes: document.getElementsByTagName('*').length
+};
+"""
+
 
 class LinkedInScraper:
-    def __init__(self, use_profile=True):
+    def __init__(self, use_profile=True, offline=False, lean=False,
+                 near_duplicates='flag', duplicate_threshold=DEFAULT_THRESHOLD):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
         # Setup Chrome options
         options = webdriver.ChromeOptions()
         options.add_argument('--start-maximized')
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        # Exact, live performance.memory values for scroll_stats; without it
+        # Chrome buckets the heap size and refreshes it only every 20 minutes
+        options.add_argument('--enable-precise-memory-info')
+        
+        # Lean mode: don't load images, media or fonts for long scrapes
+        self.lean = lean
+        if lean:
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+            })
+            options.add_argument('--autoplay-policy=user-gesture-required')
         
         # Use a separate Chrome profile for Selenium
         if use_profile:
-            import os
             # Create a selenium-specific profile directory
             selenium_profile = os.path.join(os.getcwd(), 'selenium_profile')
             options.add_argument(f'--user-data-dir={selenium_profile}')
@@ -28,10 +246,22 @@ class LinkedInScraper:
         
         # Initialize driver
         self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(resolve_chromedriver(offline=offline)),
             options=options
         )
+        if lean:
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URLS})
+            except Exception as e:
+                print(f"Could not enable request blocking: {e}")
         self.posts = []
+        self.scroll_stats = []
+        
+        # Reposts and copied posts: 'flag' marks them, 'drop' skips them, None disables
+        self.near_duplicates = near_duplicates
+        self.duplicate_index = NearDuplicateIndex(threshold=duplicate_threshold)
+        self.duplicates_dropped = 0
         
     def login_prompt(self):
         """Navigate to LinkedIn and wait for it to load"""
@@ -50,6 +280,8 @@ class LinkedInScraper:
         
     def scroll_and_extract(self, num_scrolls=10, scroll_pause=2):
         """Scroll through feed and extract post descriptions"""
+        from selenium.webdriver.common.by import By
+
         print(f"Starting to scroll and extract posts...")
         print(f"Will perform {num_scrolls} scrolls\n")
         
@@ -57,35 +289,23 @@ class LinkedInScraper:
         seen_posts = set()
         
         for scroll_num in range(num_scrolls):
+            scroll_start = time.perf_counter()
+            post_elements = []
+            expansion = {'expanded': 0, 'pending': [], 'seconds': 0.0}
+            
             # Get all posts currently visible
             try:
-                # Expand all "see more" buttons before extracting
-                try:
-                    see_more_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR,
-                        "button.feed-shared-inline-show-more-text__see-more-less-toggle, "
-                        "button[aria-label*='see more'], "
-                        "button.see-more"
-                    )
-                    for button in see_more_buttons:
-                        try:
-                            if button.is_displayed() and button.is_enabled():
-                                self.driver.execute_script("arguments[0].click();", button)
-                                time.sleep(0.2)
-                        except:
-                            continue
-                except:
-                    pass
+                # Expand "see more" buttons in the page with a single call
+                expansion = self.expand_see_more()
                 
                 # Get all posts - including reposts and shared posts
-                post_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, 
-                    "div.feed-shared-update-v2, "
-                    "div[data-urn*='activity'], "
-                    "div.feed-shared-update-v2__content"
-                )
+                post_elements = self.driver.find_elements(By.CSS_SELECTOR, POST_SELECTOR)
+                pending_posts = expansion['pending'] or []
                 
                 for post in post_elements:
+                    # Still truncated: leave it unseen so the next scroll retries it
+                    if post in pending_posts:
+                        continue
                     try:
                         # Get unique identifier for the post
                         post_id = post.get_attribute('data-urn')
@@ -166,6 +386,22 @@ class LinkedInScraper:
                                 except:
                                     continue
                             
+                            # Check for reposts / copies of an earlier post's text
+                            duplicate = None
+                            if description and self.near_duplicates:
+                                duplicate = self.duplicate_index.check(description, key=len(self.posts) + 1)
+                            
+                            # Only drop copies that bring no new contact; a copy with a
+                            # different address is kept (and flagged)
+                            new_emails = set(emails)
+                            if duplicate:
+                                new_emails -= set(self.posts[duplicate[0] - 1]['emails'])
+                            if duplicate and self.near_duplicates == 'drop' and not new_emails:
+                                self.duplicates_dropped += 1
+                                print(f"Skipped near-duplicate of post #{duplicate[0]} from {author} "
+                                      f"({duplicate[1]:.0%} similar)")
+                                continue
+                            
                             # Only save if we have description or emails
                             if description or emails:
                                 post_data = {
@@ -173,12 +409,20 @@ class LinkedInScraper:
                                     'description': description,
                                     'emails': list(set(emails))  # Remove duplicates
                                 }
+                                if duplicate:
+                                    # Addresses already on the original go in known_emails so
+                                    # they aren't contacted a second time
+                                    post_data['emails'] = list(new_emails)
+                                    post_data['known_emails'] = list(set(emails) - new_emails)
+                                    post_data['duplicate_of'] = duplicate[0]
                                 self.posts.append(post_data)
                                 
                                 # Print extraction info
                                 info = f"Post #{len(self.posts)} from {author}"
-                                if emails:
-                                    info += f" | Emails: {', '.join(emails)}"
+                                if post_data['emails']:
+                                    info += f" | Emails: {', '.join(post_data['emails'])}"
+                                if duplicate:
+                                    info += f" | Near-duplicate of #{duplicate[0]} ({duplicate[1]:.0%} similar)"
                                 print(info)
                     
                     except Exception as e:
@@ -187,14 +431,43 @@ class LinkedInScraper:
             except Exception as e:
                 print(f"Error extracting posts: {e}")
             
+            # Lean mode: drop the posts we've fully extracted from the DOM.
+            # Posts still waiting on "see more" stay for the next scroll, and
+            # nothing is pruned if expansion failed altogether.
+            if self.lean and post_elements and expansion['pending'] is not None:
+                try:
+                    self.driver.execute_script(PRUNE_POSTS_SCRIPT, post_elements, expansion['pending'])
+                except Exception as e:
+                    print(f"Error pruning posts: {e}")
+            
             # Scroll down
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            work_time = time.perf_counter() - scroll_start
             time.sleep(scroll_pause)
             
             # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
+            stats_start = time.perf_counter()
+            page_stats = self.driver.execute_script(PAGE_STATS_SCRIPT)
+            work_time += time.perf_counter() - stats_start
+            new_height = page_stats['height']
             
-            print(f"Scroll {scroll_num + 1}/{num_scrolls} complete. Total posts: {len(self.posts)}")
+            # Record per-scroll cost (excluding scroll_pause) and page memory
+            heap_mb = page_stats['heap'] / (1024 * 1024) if page_stats['heap'] else None
+            self.scroll_stats.append({
+                'scroll': scroll_num + 1,
+                'seconds': round(work_time, 4),
+                'js_heap_mb': round(heap_mb, 2) if heap_mb is not None else None,
+                'dom_nodes': page_stats['nodes'],
+                'expanded': expansion['expanded'],
+                'expand_seconds': round(expansion['seconds'], 4)
+            })
+            
+            info = f"Scroll {scroll_num + 1}/{num_scrolls} complete. Total posts: {len(self.posts)}"
+            info += f" | {work_time:.2f}s"
+            info += f" | Expanded {expansion['expanded']} in {expansion['seconds']:.2f}s"
+            if heap_mb is not None:
+                info += f" | JS heap: {heap_mb:.1f} MB"
+            print(info)
             
             # Break if we've reached the end
             if new_height == last_height:
@@ -206,8 +479,58 @@ class LinkedInScraper:
         print(f"\n{'='*50}")
         print(f"Extraction complete! Total posts extracted: {len(self.posts)}")
         print(f"Total emails found: {sum(len(p['emails']) for p in self.posts)}")
+        if self.near_duplicates == 'drop':
+            print(f"Near-duplicates skipped: {self.duplicates_dropped}")
+        elif self.near_duplicates:
+            print(f"Near-duplicates flagged: {sum(1 for p in self.posts if 'duplicate_of' in p)}")
+        self.print_scroll_summary()
         print(f"{'='*50}\n")
     
+    def print_scroll_summary(self):
+        """Compare per-scroll time and JS heap between the start and end of the run"""
+        if len(self.scroll_stats) < 2:
+            return
+        window = max(1, len(self.scroll_stats) // 10)
+        first = self.scroll_stats[:window]
+        last = self.scroll_stats[-window:]
+        
+        def average(rows, key):
+            values = [row[key] for row in rows if row[key] is not None]
+            return sum(values) / len(values) if values else None
+        
+        print(f"Per-scroll time: {average(first, 'seconds'):.3f}s (first {window}) -> "
+              f"{average(last, 'seconds'):.3f}s (last {window})")
+        first_heap, last_heap = average(first, 'js_heap_mb'), average(last, 'js_heap_mb')
+        if first_heap is not None and last_heap is not None:
+            print(f"JS heap: {first_heap:.1f} MB -> {last_heap:.1f} MB")
+        print(f"DOM nodes: {average(first, 'dom_nodes'):.0f} -> {average(last, 'dom_nodes'):.0f}")
+        total_expanded = sum(row['expanded'] for row in self.scroll_stats)
+        print(f"See more: {total_expanded} posts expanded, "
+              f"{average(self.scroll_stats, 'expand_seconds'):.3f}s per scroll")
+    
+    def save_scroll_stats(self, filename='scroll_stats.json'):
+        """Save per-scroll timing and memory stats to JSON file"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.scroll_stats, f, indent=2)
+        print(f"Scroll stats saved to {filename}")
+    
+    def expand_see_more(self, timeout=1.5):
+        """Expand all not-yet-expanded "see more" posts in one script call
+
+        Returns the number of buttons clicked and the post elements whose text
+        has not finished expanding yet.
+        """
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(
+                EXPAND_SEE_MORE_SCRIPT, SEE_MORE_SELECTOR, POST_SELECTOR, int(timeout * 1000)
+            )
+            expanded, pending = result['expanded'], result['pending']
+        except Exception as e:
+            print(f"Error expanding posts: {e}")
+            expanded, pending = 0, None
+        return {'expanded': expanded, 'pending': pending, 'seconds': time.perf_counter() - start}
+    
     def save_to_file(self, filename='linkedin_posts.json'):
         """Save extracted posts to JSON file"""
         with open(filename, 'w', encoding='utf-8') as f:
@@ -232,7 +555,14 @@ class LinkedInScraper:
 
 
 def main():
-    scraper = LinkedInScraper()
+    # Set SCRAPER_OFFLINE=1 to start without any network driver lookup
+    # Set SCRAPER_LEAN=1 to block media and prune processed posts on long runs
+    # Set SCRAPER_SCROLLS=<n> to change how many times the feed is scrolled
+    num_scrolls = int(os.environ.get('SCRAPER_SCROLLS', '10'))
+    scraper = LinkedInScraper(
+        offline=os.environ.get('SCRAPER_OFFLINE') == '1',
+        lean=os.environ.get('SCRAPER_LEAN') == '1'
+    )
     
     try:
         # Step 1: Open LinkedIn and wait for manual login
@@ -240,7 +570,7 @@ def main():
         
         # Step 2: Scroll and extract posts
         # Adjust num_scrolls and scroll_pause as needed
-        scraper.scroll_and_extract(num_scrolls=10, scroll_pause=2)
+        scraper.scroll_and_extract(num_scrolls=num_scrolls, scroll_pause=2)
         
         # Step 3: Display sample posts
         scraper.print_posts(limit=5)
@@ -260,6 +590,9 @@ def main():
         traceback.print_exc()
     
     finally:
+        # Lean runs keep their per-scroll time/heap series, even if interrupted
+        if scraper.lean and scraper.scroll_stats:
+            scraper.save_scroll_stats('scroll_stats.json')
         try:
             scraper.close()
         except:
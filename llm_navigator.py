@@ -1,11 +1,11 @@
-import pyautogui
-import pytesseract
-from PIL import Image, ImageChops
 import time
 import logging
 import re
 import sys
 
+# pyautogui, pytesseract and PIL are imported inside the helpers that use
+# them so the module itself loads instantly.
+
 # ==============================
 # Configurable constants
 # ==============================
@@ -33,16 +33,19 @@ logging.basicConfig(
 # ==============================
 def capture_region(region):
     """Take a screenshot of the given region."""
+    import pyautogui
     x, y, w, h = region
     return pyautogui.screenshot(region=(x, y, w, h))
 
 def has_changed(img1, img2):
     """Check if two images differ."""
+    from PIL import ImageChops
     diff = ImageChops.difference(img1, img2)
     return diff.getbbox() is not None
 
-def ocr_image(img: Image.Image):
+def ocr_image(img):
     """Extract and clean text from image using OCR."""
+    import pytesseract
     raw_text = pytesseract.image_to_string(img)
     return clean_text(raw_text)
 
@@ -63,6 +66,7 @@ def clean_text(text):
 
 def click_icon(icon_path, confidence=DEFAULT_CONFIDENCE, timeout=DEFAULT_TIMEOUT):
     """Click an icon on screen by image matching."""
+    import pyautogui
     logging.info(f"Looking for {icon_path}...")
     start_time = time.time()
     wait_time = 0.5
@@ -86,6 +90,7 @@ def click_icon(icon_path, confidence=DEFAULT_CONFIDENCE, timeout=DEFAULT_TIMEOUT
 
 def focus_search_bar():
     """Focus the browser search bar."""
+    import pyautogui
     if click_icon(SEARCH_BAR_ICON, timeout=5):
         return True
     pyautogui.hotkey("ctrl", "l")
@@ -94,6 +99,7 @@ def focus_search_bar():
 
 def open_browser_and_navigate():
     """Open the browser and navigate to ChatGPT page."""
+    import pyautogui
     if not click_icon(BROWSER_ICON, timeout=15):
         logging.error("Browser icon not found.")
         return False
@@ -109,6 +115,7 @@ def open_browser_and_navigate():
 
 def send_query(query):
     """Send a query to the LLM (active input box assumed)."""
+    import pyautogui
     pyautogui.write(query)
     pyautogui.press("enter")
     logging.info(f"Query sent: {query}")
@@ -116,6 +123,7 @@ def send_query(query):
 
 def collect_text(region):
     """Scroll through the region and collect OCR text."""
+    import pyautogui
     collected_text = []
     seen_chunks = set()
 
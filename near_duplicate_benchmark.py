@@ -0,0 +1,106 @@
+import random
+import time
+
+from near_duplicates import NearDuplicateIndex, minhash
+
+# ==============================
+# Configurable constants
+# ==============================
+NUM_POSTS = 100_000
+DUPLICATE_RATE = 0.05      # Share of posts that are edited copies of an earlier post
+WORDS_PER_POST = (40, 120)
+EDITS_PER_COPY = (1, 3)    # Word substitutions/insertions/deletions per copy
+VOCABULARY_SIZE = 20_000
+SEED = 42
+FIND_SAMPLE = 1_000        # Signatures used for the find()-only timing
+
+
+def make_vocabulary(rng, size=VOCABULARY_SIZE):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size)]
+
+
+def edit_copy(rng, words, vocabulary):
+    """Return a lightly edited copy of a post, like a repost or a recruiter's template."""
+    words = list(words)
+    for _ in range(rng.randint(*EDITS_PER_COPY)):
+        position = rng.randrange(len(words))
+        action = rng.choice(("replace", "insert", "delete"))
+        if action == "replace":
+            words[position] = rng.choice(vocabulary)
+        elif action == "insert":
+            words.insert(position, rng.choice(vocabulary))
+        elif len(words) > 1:
+            del words[position]
+    if rng.random() < 0.5:
+        words.append("#hiring")
+    return words
+
+
+def make_corpus(rng, num_posts=NUM_POSTS):
+    """Return a list of (text, original_index or None) pairs."""
+    vocabulary = make_vocabulary(rng)
+    corpus = []
+    originals = []
+    for _ in range(num_posts):
+        if originals and rng.random() < DUPLICATE_RATE:
+            source = rng.choice(originals)
+            words = edit_copy(rng, corpus[source][0].split(), vocabulary)
+            corpus.append((" ".join(words), source))
+        else:
+            words = [rng.choice(vocabulary) for _ in range(rng.randint(*WORDS_PER_POST))]
+            originals.append(len(corpus))
+            corpus.append((" ".join(words), None))
+    return corpus
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    rng = random.Random(SEED)
+    print(f"Building synthetic corpus of {NUM_POSTS:,} posts ({DUPLICATE_RATE:.0%} near-duplicates)...")
+    corpus = make_corpus(rng)
+
+    index = NearDuplicateIndex()
+    lookup_times = []
+    true_positives = false_positives = injected = 0
+
+    # A lookup is what the scraper does per post: fingerprint + find + add
+    for key, (text, source) in enumerate(corpus):
+        start = time.perf_counter()
+        match = index.check(text, key)
+        lookup_times.append(time.perf_counter() - start)
+
+        if source is not None:
+            injected += 1
+            if match is not None:
+                true_positives += 1
+        elif match is not None:
+            false_positives += 1
+
+    # find() alone on the full index, for comparison
+    sample = [minhash(text) for text, _ in rng.sample(corpus, FIND_SAMPLE)]
+    find_times = []
+    for signature in sample:
+        start = time.perf_counter()
+        index.find(signature)
+        find_times.append(time.perf_counter() - start)
+
+    lookup_times.sort()
+    find_times.sort()
+    originals = len(corpus) - injected
+    print(f"\nLookup (check) median: {percentile(lookup_times, 0.5) * 1e6:8.1f} us")
+    print(f"Lookup (check) p99:    {percentile(lookup_times, 0.99) * 1e6:8.1f} us")
+    print(f"Lookup (check) max:    {lookup_times[-1] * 1e6:8.1f} us")
+    slow = sum(1 for t in lookup_times if t > 1e-3)
+    print(f"Lookups over 1 ms:     {slow:8,}  ({slow / len(lookup_times):.3%})")
+    print(f"find() only median:    {percentile(find_times, 0.5) * 1e6:8.1f} us")
+    print(f"find() only p99:       {percentile(find_times, 0.99) * 1e6:8.1f} us")
+    print(f"Recall:                {true_positives / injected:8.1%}  ({true_positives:,}/{injected:,} injected copies)")
+    print(f"False positives:       {false_positives / originals:8.2%}  ({false_positives:,}/{originals:,} originals)")
+    print(f"Index size:            {len(index):,} fingerprints")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import hashlib
+import re
+from array import array
+from collections import OrderedDict
+from operator import eq
+
+# ==============================
+# Configurable constants
+# ==============================
+NUM_PERMUTATIONS = 64          # MinHash signature length (power of two)
+NUM_BANDS = 16                 # LSH bands (NUM_PERMUTATIONS must divide evenly)
+DEFAULT_THRESHOLD = 0.7        # Estimated Jaccard similarity to count as a near-duplicate
+DEFAULT_MAX_SIZE = 100_000     # Oldest signatures are evicted past this many
+SHINGLE_SIZE = 3               # Words per shingle
+MIN_TOKENS = 5                 # Shorter texts are too small to fingerprint reliably
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+# Emails are left out of the fingerprint: the same body with a different
+# contact is still a near-duplicate, and callers compare emails themselves.
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+
+_BIN_BITS = NUM_PERMUTATIONS.bit_length() - 1
+_VALUE_BITS = 26               # Low bits of a signature value; the rest hold the densification offset
+_EMPTY = 1 << 32
+
+
+def tokenize(text):
+    """Lowercase the text, drop emails and split it into word tokens."""
+    return TOKEN_PATTERN.findall(EMAIL_PATTERN.sub(" ", text).lower())
+
+
+def minhash(text, shingle_size=SHINGLE_SIZE):
+    """Return the MinHash signature of a text's word shingles, or None if it is too short."""
+    tokens = tokenize(text)
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    shingles = {" ".join(tokens[i:i + shingle_size]) for i in range(max(1, len(tokens) - shingle_size + 1))}
+
+    # One-permutation hashing: each shingle is hashed once, its low bits pick
+    # a bin and its high bits compete for that bin's minimum
+    bins = [_EMPTY] * NUM_PERMUTATIONS
+    bin_mask = NUM_PERMUTATIONS - 1
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        value = h >> (64 - _VALUE_BITS)
+        if value < bins[h & bin_mask]:
+            bins[h & bin_mask] = value
+
+    # Rotation densification: an empty bin borrows the next filled bin to its
+    # right, tagged with the distance so borrowed values don't collide
+    signature = list(bins)
+    borrowed = None
+    distance = 0
+    for i in reversed(range(2 * NUM_PERMUTATIONS)):
+        j = i & bin_mask
+        if bins[j] != _EMPTY:
+            borrowed, distance = bins[j], 0
+        else:
+            distance += 1
+            if i < NUM_PERMUTATIONS and borrowed is not None:
+                signature[j] = borrowed | (distance << _VALUE_BITS)
+    return array("I", signature)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(map(eq, a, b)) / len(a)
+
+
+class NearDuplicateIndex:
+    """
+    In-memory MinHash/LSH index for spotting reposts and copied posts.
+
+    Signatures are split into bands; only posts sharing at least one whole
+    band are compared, so lookups stay fast as the index grows.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, max_size=DEFAULT_MAX_SIZE, num_bands=NUM_BANDS):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.num_bands = num_bands
+        self.rows = NUM_PERMUTATIONS // num_bands
+        self.signatures = OrderedDict()   # key -> signature, oldest first
+        self.buckets = {}                 # band hash -> key, or a set of keys on collision
+        self._next_key = 0
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _band_hashes(self, signature):
+        rows = self.rows
+        for band in range(self.num_bands):
+            yield hash((band, signature[band * rows:(band + 1) * rows].tobytes()))
+
+    def find(self, signature):
+        """Return (key, similarity) of the most similar indexed near-duplicate, or None."""
+        candidates = set()
+        for band_hash in self._band_hashes(signature):
+            bucket = self.buckets.get(band_hash)
+            if bucket is None:
+                continue
+            if isinstance(bucket, set):
+                candidates.update(bucket)
+            else:
+                candidates.add(bucket)
+
+        best = None
+        best_similarity = self.threshold
+        for key in candidates:
+            score = similarity(signature, self.signatures[key])
+            if score >= best_similarity:
+                best, best_similarity = key, score
+        if best is None:
+            return None
+        return best, best_similarity
+
+    def add(self, signature, key=None):
+        """Index a signature under key (auto-numbered if omitted) and return the key."""
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        if key in self.signatures:
+            self._remove(key)
+
+        self.signatures[key] = signature
+        for band_hash in self._band_hashes(signature):
+            bucket = self.buckets.get(band_hash)
+            if bucket is None:
+                self.buckets[band_hash] = key
+            elif isinstance(bucket, set):
+                bucket.add(key)
+            else:
+                self.buckets[band_hash] = {bucket, key}
+
+        while len(self.signatures) > self.max_size:
+            self._remove(next(iter(self.signatures)))
+        return key
+
+    def _remove(self, key):
+        signature = self.signatures.pop(key)
+        for band_hash in self._band_hashes(signature):
+            bucket = self.buckets.get(band_hash)
+            if isinstance(bucket, set):
+                bucket.discard(key)
+                if len(bucket) == 1:
+                    self.buckets[band_hash] = bucket.pop()
+            elif bucket == key:
+                del self.buckets[band_hash]
+
+    def check(self, text, key=None):
+        """
+        Look up a text and index it if it is new.
+
+        Returns (key, similarity) of the earlier near-duplicate, or None if the
+        text is new (or too short to fingerprint).
+        """
+        signature = minhash(text)
+        if signature is None:
+            return None
+        match = self.find(signature)
+        if match is None:
+            self.add(signature, key)
+        return match
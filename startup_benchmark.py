@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# ==============================
+# Configurable constants
+# ==============================
+ENTRY_POINTS = ["linkedin_scrapper", "email_sender", "llm_navigator"]
+HEAVY_MODULES = ["selenium.webdriver", "webdriver_manager.chrome", "pyautogui", "pytesseract", "PIL.Image", "cv2"]
+RUNS = 5
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Runs in a fresh interpreter so every measurement is a cold import
+IMPORT_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {here!r})
+start = time.perf_counter()
+try:
+    __import__({module!r})
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{"seconds": time.perf_counter() - start, "error": error}}))
+"""
+
+# Uses a throwaway driver cache so the first run really starts cold, and
+# reports whether the cached path was there before the call
+DRIVER_SNIPPET = """
+import json, os, sys, time
+sys.path.insert(0, {here!r})
+import linkedin_scrapper
+linkedin_scrapper.DRIVER_CACHE_FILE = {cache_file!r}
+cached = linkedin_scrapper._load_driver_cache().get(linkedin_scrapper.get_chrome_version() or 'unknown')
+cache_hit = bool(cached and os.path.exists(cached))
+start = time.perf_counter()
+try:
+    linkedin_scrapper.resolve_chromedriver(offline={offline!r})
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{"seconds": time.perf_counter() - start, "error": error, "cache_hit": cache_hit}}))
+"""
+
+# Full driver startup as main() does it (minus the profile), then quit
+SCRAPER_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {here!r})
+import linkedin_scrapper
+linkedin_scrapper.DRIVER_CACHE_FILE = {cache_file!r}
+start = time.perf_counter()
+try:
+    scraper = linkedin_scrapper.LinkedInScraper(use_profile=False, lean={lean!r})
+    scraper.driver.quit()
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{"seconds": time.perf_counter() - start, "error": error}}))
+"""
+
+VERSION_SNIPPET = """
+import json, sys
+sys.path.insert(0, {here!r})
+import linkedin_scrapper
+print(json.dumps({{"version": linkedin_scrapper.get_chrome_version()}}))
+"""
+
+
+def run_snippet(snippet):
+    """Run a snippet in a fresh interpreter and return its JSON result."""
+    result = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True)
+    try:
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"seconds": None, "error": (result.stderr.strip().splitlines() or ["no output"])[-1]}
+
+
+def measure(label, snippet, runs=RUNS):
+    """Run a snippet several times and print the median time."""
+    timings = []
+    cache_hits = []
+    error = None
+    for _ in range(runs):
+        outcome = run_snippet(snippet)
+        if outcome["error"]:
+            error = outcome["error"]
+            break
+        timings.append(outcome["seconds"])
+        if "cache_hit" in outcome:
+            cache_hits.append(outcome["cache_hit"])
+
+    if error:
+        print(f"{label:<40} failed: {error}")
+        return None
+
+    timings.sort()
+    median = timings[len(timings) // 2]
+    info = f"{label:<40} {median * 1000:8.1f} ms  (min {timings[0] * 1000:.1f}, max {timings[-1] * 1000:.1f})"
+    if cache_hits:
+        info += f"  cache hits: {sum(cache_hits)}/{len(cache_hits)}"
+    print(info)
+    return median
+
+
+def main():
+    print(f"Startup benchmark ({RUNS} cold runs each, median shown)\n")
+
+    print("Entry point import cost:")
+    for module in ENTRY_POINTS:
+        measure(f"  import {module}", IMPORT_SNIPPET.format(here=HERE, module=module))
+
+    print("\nHeavy dependency import cost (paid lazily on first use):")
+    for module in HEAVY_MODULES:
+        measure(f"  import {module}", IMPORT_SNIPPET.format(here=HERE, module=module))
+
+    cache_dir = tempfile.mkdtemp(prefix="driver_cache_")
+    cache_file = os.path.join(cache_dir, "chromedriver.json")
+    try:
+        print("\nChromeDriver resolution cost:")
+        chrome_version = run_snippet(VERSION_SNIPPET.format(here=HERE)).get("version")
+        if not chrome_version:
+            print("  Chrome version not detected: nothing is cached, every online run hits the network")
+        # The first run starts from an empty cache and fills it; later runs should hit it
+        online = DRIVER_SNIPPET.format(here=HERE, cache_file=cache_file, offline=False)
+        measure("  resolve_chromedriver() first run", online, runs=1)
+        measure("  resolve_chromedriver() repeat", online)
+        measure("  resolve_chromedriver(offline=True)", DRIVER_SNIPPET.format(here=HERE, cache_file=cache_file, offline=True))
+
+        print("\nDriver init cost (LinkedInScraper() then quit):")
+        if not chrome_version:
+            print("  skipped: Chrome not found")
+        else:
+            measure("  LinkedInScraper()", SCRAPER_SNIPPET.format(here=HERE, cache_file=cache_file, lean=False), runs=3)
+            measure("  LinkedInScraper(lean=True)", SCRAPER_SNIPPET.format(here=HERE, cache_file=cache_file, lean=True), runs=3)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()